@@ -7,16 +7,29 @@
 import os
 import sys
 import time
-import json
+import atexit
+import queue
+import asyncio
+import threading
 import logging
 import argparse
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple
-from datetime import date, timedelta
-from dateutil.relativedelta import relativedelta
+from datetime import timedelta
 
+import aiohttp
+import orjson
 import requests
+import requests_cache
+import numpy as np
 import pandas as pd
+import polars as pl
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
 from tqdm import tqdm
 from dotenv import load_dotenv, find_dotenv
 
@@ -28,6 +41,9 @@ COLS = [
     "vote_average", "vote_count", "popularity", "original_language",
     "overview", "poster_url",
 ]
+# Prebuilt once: passing a ready pd.Index to the constructor skips both the
+# per-call Index build and any reindex pass.
+_COL_INDEX = pd.Index(COLS)
 
 # ---------------- Robust .env loader ----------------
 def load_project_dotenv():
@@ -73,14 +89,51 @@ if not TMDB_BEARER:
     raise RuntimeError("Set TMDB_BEARER env var first (v4 read access token).")
 
 BASE = "https://api.themoviedb.org/3"
-HEADERS = {"Authorization": f"Bearer {TMDB_BEARER}", "Accept": "application/json"}
+HEADERS = {
+    "Authorization": f"Bearer {TMDB_BEARER}",
+    "Accept": "application/json",
+    "Accept-Encoding": "gzip",  # TMDB JSON compresses ~5x on the wire
+}
 
 OUT_DIR = Path("tmdb_monthly_parts")
 OUT_DIR.mkdir(exist_ok=True)
 CHECKPOINT_MONTHS = Path("tmdb_monthly_checkpoint.json")
 
-SESSION = requests.Session()
-SESSION.headers.update(HEADERS)
+POOL_SIZE = 32
+HTTP_CACHE_NAME = "tmdb_http_cache"
+
+def make_session(use_cache: bool = True) -> requests.Session:
+    """Sync session, by default backed by a local sqlite HTTP cache.
+
+    Discover pages go through aiohttp; this session serves the
+    configuration/genre endpoints, whose responses barely change, so
+    re-runs skip the network entirely.
+    """
+    if use_cache:
+        s: requests.Session = requests_cache.CachedSession(
+            HTTP_CACHE_NAME,
+            expire_after=timedelta(days=7),
+            urls_expire_after={
+                "api.themoviedb.org/3/configuration": timedelta(days=30),
+                "api.themoviedb.org/3/genre/*": timedelta(days=30),
+            },
+            allowable_methods=("GET",),
+            stale_if_error=True,
+        )
+    else:
+        s = requests.Session()
+    s.headers.update(HEADERS)
+    s.mount("https://", requests.adapters.HTTPAdapter(
+        pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=0))
+    return s
+
+SESSION = make_session()
+
+def make_aiohttp_session() -> aiohttp.ClientSession:
+    """Shared session factory: pooled connections, cached DNS, 25s budget."""
+    connector = aiohttp.TCPConnector(limit=POOL_SIZE, ttl_dns_cache=300)
+    return aiohttp.ClientSession(headers=HEADERS, connector=connector,
+                                 timeout=aiohttp.ClientTimeout(total=25))
 
 # ---------- logging setup ----------
 def setup_logging(level: str = "INFO", log_file: Optional[str] = None) -> None:
@@ -109,7 +162,7 @@ def safe_get(path: str, params: Optional[Dict[str, Any]] = None,
             continue
 
         if resp.status_code == 200:
-            return resp.json()
+            return orjson.loads(resp.content)
         if resp.status_code == 429:
             ra = resp.headers.get("Retry-After")
             try:
@@ -141,10 +194,80 @@ def get_genre_map(lang: str = "en-US") -> Dict[int, str]:
     j = safe_get("/genre/movie/list", params={"language": lang})
     return {g["id"]: g["name"] for g in j.get("genres", [])}
 
-# ---------- Discover (paged) ----------
-def discover_all(date_from: str, date_to: str, language: str = "en-US",
-                 min_votes: int = 0, max_pages: Optional[int] = None,
-                 polite_sleep: float = 0.08) -> List[Dict[str, Any]]:
+# ---------- rate limiting ----------
+# TMDB allows ~40 requests per 10 s; 3.8/s leaves a safety margin.
+TMDB_RATE = 3.8
+TMDB_BURST = 40
+
+class TokenBucket:
+    """Async token bucket shared by all fetchers on one event loop.
+
+    Fixed per-request sleeps stop working once fetches run concurrently:
+    every coroutine sleeps in parallel, the aggregate rate explodes and the
+    429 backoff eats the concurrency gain. Acquiring a token before each
+    request keeps the global rate under TMDB's budget instead.
+    """
+    def __init__(self, rate: float = TMDB_RATE, capacity: int = TMDB_BURST):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity,
+                                  self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1.0:
+                    self.tokens -= 1.0
+                    return
+                await asyncio.sleep((1.0 - self.tokens) / self.rate)
+
+# ---------- async HTTP helper with retries ----------
+async def safe_get_async(session: aiohttp.ClientSession, path: str,
+                         params: Optional[Dict[str, Any]] = None,
+                         max_retries: int = 6, backoff_base: float = 1.0,
+                         bucket: Optional[TokenBucket] = None) -> Dict[str, Any]:
+    url = f"{BASE}{path}"
+    params = {k: str(v) for k, v in (params or {}).items()}
+    for attempt in range(max_retries):
+        if bucket is not None:
+            await bucket.acquire()
+        try:
+            async with session.get(url, params=params) as resp:
+                if resp.status == 200:
+                    return orjson.loads(await resp.read())
+                if resp.status == 429:
+                    ra = resp.headers.get("Retry-After")
+                    try:
+                        wait = int(ra) if ra else backoff_base * (2 ** attempt)
+                    except Exception:
+                        wait = backoff_base * (2 ** attempt)
+                    log.warning("Rate limited. Waiting %.1fs (attempt %d)", wait, attempt + 1)
+                    await asyncio.sleep(wait)
+                    continue
+                if 500 <= resp.status < 600:
+                    wait = backoff_base * (2 ** attempt)
+                    log.warning("Server error %d. Waiting %.1fs and retrying.", resp.status, wait)
+                    await asyncio.sleep(wait)
+                    continue
+                body = await resp.text()
+                raise RuntimeError(f"HTTP {resp.status} - {body}")
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            wait = backoff_base * (2 ** attempt)
+            log.warning("Request error (attempt %d/%d). Retrying in %.1fs", attempt + 1, max_retries, wait)
+            await asyncio.sleep(wait)
+            continue
+    raise RuntimeError(f"Max retries exceeded for {url}")
+
+# ---------- Discover (paged, concurrent) ----------
+async def _discover_pages(session: aiohttp.ClientSession, sem: asyncio.Semaphore,
+                          bucket: TokenBucket, date_from: str, date_to: str,
+                          language: str, min_votes: int,
+                          max_pages: Optional[int]) -> List[Dict[str, Any]]:
     params = {
         "primary_release_date.gte": date_from,
         "primary_release_date.lte": date_to,
@@ -155,7 +278,8 @@ def discover_all(date_from: str, date_to: str, language: str = "en-US",
         "page": 1,
     }
 
-    first = safe_get("/discover/movie", params=params)
+    async with sem:
+        first = await safe_get_async(session, "/discover/movie", params=params, bucket=bucket)
     total_pages = first.get("total_pages", 1)
 
     if total_pages > TMDB_MAX_PAGES:
@@ -173,130 +297,587 @@ def discover_all(date_from: str, date_to: str, language: str = "en-US",
     movies: List[Dict[str, Any]] = list(first.get("results", []))
 
     if total_pages >= 2:
-        for p in tqdm(range(2, total_pages + 1), desc="discover pages"):
-            params["page"] = p
-            j = safe_get("/discover/movie", params=params)
-            movies.extend(j.get("results", []))
-            time.sleep(polite_sleep)
+        bar = tqdm(total=total_pages - 1, desc=f"discover {date_from}")
+
+        async def fetch_page(page: int) -> List[Dict[str, Any]]:
+            async with sem:
+                j = await safe_get_async(session, "/discover/movie",
+                                         params={**params, "page": page}, bucket=bucket)
+            bar.update(1)
+            return j.get("results", [])
+
+        try:
+            pages = await asyncio.gather(*(fetch_page(p) for p in range(2, total_pages + 1)))
+        finally:
+            bar.close()
+        for results in pages:
+            movies.extend(results)
 
     return movies
 
+async def discover_all_async(date_from: str, date_to: str, language: str = "en-US",
+                             min_votes: int = 0, max_pages: Optional[int] = None,
+                             concurrency: int = 8,
+                             session: Optional[aiohttp.ClientSession] = None,
+                             sem: Optional[asyncio.Semaphore] = None,
+                             bucket: Optional[TokenBucket] = None) -> List[Dict[str, Any]]:
+    """Fetch all discover pages for a date window.
+
+    `session`, `sem` and `bucket` can be shared by callers running several
+    windows concurrently so the request budget is bounded globally; when
+    omitted private ones are created.
+    """
+    if sem is None:
+        sem = asyncio.Semaphore(concurrency)
+    if bucket is None:
+        bucket = TokenBucket()
+    if session is not None:
+        return await _discover_pages(session, sem, bucket, date_from, date_to,
+                                     language, min_votes, max_pages)
+    async with make_aiohttp_session() as session:
+        return await _discover_pages(session, sem, bucket, date_from, date_to,
+                                     language, min_votes, max_pages)
+
+def discover_all(date_from: str, date_to: str, language: str = "en-US",
+                 min_votes: int = 0, max_pages: Optional[int] = None,
+                 concurrency: int = 8) -> List[Dict[str, Any]]:
+    """Sync entrypoint; runs the concurrent discover on a fresh event loop."""
+    return asyncio.run(discover_all_async(
+        date_from, date_to, language=language, min_votes=min_votes,
+        max_pages=max_pages, concurrency=concurrency,
+    ))
+
 # ---------- normalize ----------
+# Raw keys read from each discover result, in column order. The extractor
+# below is generated once from this tuple, so the schema is stated in one
+# place and the per-movie work is a single specialized tuple build instead
+# of repeated dynamic dict lookups.
+RAW_FIELDS = ("id", "title", "original_title", "release_date", "genre_ids",
+              "vote_average", "vote_count", "popularity", "original_language",
+              "overview", "poster_path")
+
+def _build_row_extractor():
+    getters = ", ".join(f"g({f!r})" for f in RAW_FIELDS)
+    src = f"def _row(m):\n    g = m.get\n    return ({getters})"
+    ns: Dict[str, Any] = {}
+    exec(src, ns)
+    return ns["_row"]
+
+_extract_row = _build_row_extractor()
+
 def normalize_to_df(raw_movies: List[Dict[str, Any]], image_base: str,
                     poster_size: str, genres_map: Dict[int, str]) -> pd.DataFrame:
-    rows = []
-    for m in raw_movies:
-        genre_names = [genres_map.get(gid, str(gid)) for gid in m.get("genre_ids", [])]
-        poster_path = m.get("poster_path")
-        poster_url = f"{image_base}{poster_size}{poster_path}" if poster_path else None
-        rows.append({
-            "tmdb_id": m.get("id"),
-            "title": m.get("title"),
-            "original_title": m.get("original_title"),
-            "release_date": m.get("release_date"),
-            "genres": "|".join(genre_names),
-            "vote_average": m.get("vote_average"),
-            "vote_count": m.get("vote_count"),
-            "popularity": m.get("popularity"),
-            "original_language": m.get("original_language"),
-            "overview": m.get("overview"),
-            "poster_url": poster_url,
-        })
-    return pd.DataFrame(rows).reindex(columns=COLS)
+    """Flatten raw discover results into the fixed-column schema.
+
+    Rows are read with the generated extractor and transposed into columns
+    with one zip, so pandas gets ready-made columns and skips row-wise
+    type inference.
+    """
+    if raw_movies:
+        (tmdb_id, title, original_title, release_date, genre_ids,
+         vote_average, vote_count, popularity, raw_language,
+         overview, poster_path) = zip(*map(_extract_row, raw_movies))
+    else:
+        tmdb_id = title = original_title = release_date = genre_ids = \
+            vote_average = vote_count = popularity = raw_language = \
+            overview = poster_path = ()
+
+    # Genre combinations repeat heavily ("Drama|Romance" shows up thousands
+    # of times), so each distinct genre_ids tuple is joined only once.
+    # Bound-method locals keep the per-row work to two dict probes.
+    genre_join_cache: Dict[Tuple[int, ...], str] = {}
+    _cache_get = genre_join_cache.get
+    _name_get = genres_map.get
+    genres: List[str] = []
+    _append = genres.append
+    for gids in genre_ids:
+        gkey = tuple(gids) if gids else ()
+        joined = _cache_get(gkey)
+        if joined is None:
+            joined = "|".join(_name_get(g) or str(g) for g in gkey)
+            genre_join_cache[gkey] = joined
+        _append(joined)
+
+    # intern so the ~50 distinct language codes share one str object each
+    original_language = [sys.intern(lang) if lang else None for lang in raw_language]
+
+    # Both columns are low-cardinality; Categorical stores one value table
+    # plus small integer codes instead of a Python str reference per row,
+    # and feeds the dictionary-encoded part schema without re-encoding.
+    genres = pd.Categorical(genres)
+    original_language = pd.Categorical(original_language)
+
+    # Poster URLs share one fixed prefix per run, so the concatenation is
+    # done as a single vectorized pass instead of n f-strings.
+    pp_ser = pd.Series(poster_path, dtype=object)
+    poster_url = (f"{image_base}{poster_size}" + pp_ser).where(
+        pp_ser.notna() & (pp_ser != ""), None)
+
+    # Numerics go straight into contiguous typed buffers (no object boxes,
+    # no inference scan). tmdb_id is required by the API so a missing one is
+    # a hard error; the metrics fall back to 0 / NaN like TMDB itself does.
+    n = len(raw_movies)
+    tmdb_id = np.fromiter(tmdb_id, dtype=np.int64, count=n)
+    vote_count = np.fromiter((v if v is not None else 0 for v in vote_count),
+                             dtype=np.int32, count=n)
+    vote_average = np.fromiter((v if v is not None else np.nan for v in vote_average),
+                               dtype=np.float32, count=n)
+    popularity = np.fromiter((v if v is not None else np.nan for v in popularity),
+                             dtype=np.float32, count=n)
+
+    # Single dict-of-columns constructor call: the transposed tuples go in
+    # as-is, no per-column copies and no reindex afterwards.
+    return pd.DataFrame({
+        "tmdb_id": tmdb_id,
+        "title": title,
+        "original_title": original_title,
+        "release_date": release_date,
+        "genres": genres,
+        "vote_average": vote_average,
+        "vote_count": vote_count,
+        "popularity": popularity,
+        "original_language": original_language,
+        "overview": overview,
+        "poster_url": poster_url,
+    }, columns=_COL_INDEX, copy=False)
+
+# Below this row count a process pool costs more in pickling and startup
+# than the normalization itself; a typical month (~10k rows max) sits
+# right at the edge, so only unusually large batches fan out.
+PARALLEL_NORMALIZE_MIN_ROWS = 5000
+
+def normalize_to_df_parallel(raw_movies: List[Dict[str, Any]], image_base: str,
+                             poster_size: str, genres_map: Dict[int, str],
+                             workers: Optional[int] = None) -> pd.DataFrame:
+    """Normalize a large raw batch across worker processes.
+
+    The batch is split into one slice per worker, each slice runs
+    normalize_to_df in its own process, and the partial frames are
+    concatenated. Small batches are delegated to the sequential path
+    unchanged.
+    """
+    n = len(raw_movies)
+    if n < PARALLEL_NORMALIZE_MIN_ROWS:
+        return normalize_to_df(raw_movies, image_base, poster_size, genres_map)
+
+    workers = workers or os.cpu_count() or 1
+    step = -(-n // workers)  # ceil division
+    batches = [raw_movies[i:i + step] for i in range(0, n, step)]
+    fn = partial(normalize_to_df, image_base=image_base,
+                 poster_size=poster_size, genres_map=genres_map)
+    with ProcessPoolExecutor(max_workers=len(batches)) as pool:
+        frames = list(pool.map(fn, batches))
+
+    df = pd.concat(frames, ignore_index=True)
+    # Per-slice Categoricals carry different category tables, so concat
+    # falls back to object; re-encode once over the full columns.
+    df["genres"] = df["genres"].astype("category")
+    df["original_language"] = df["original_language"].astype("category")
+    return df
 
 # ---------- checkpoint helpers ----------
+# Completed months are appended one line at a time to a JSONL journal
+# (O(1) per month); the canonical JSON file is only rewritten when the
+# journal is compacted, so the full blob is not re-serialized per month.
+COMPACT_EVERY = 100
+_appends_since_compact = 0
+
+def _checkpoint_log_path() -> Path:
+    return CHECKPOINT_MONTHS.with_suffix(".jsonl")
+
+# Payloads under one page can be rewritten in place with a single pwrite;
+# a torn write just leaves garbage that load_checkpoint already treats as
+# an empty canonical file, with the journal still carrying the records.
+SMALL_CHECKPOINT_BYTES = 512
+
 def save_checkpoint(d: Dict[str, Any]) -> None:
+    payload = orjson.dumps(d)
+    if len(payload) < SMALL_CHECKPOINT_BYTES:
+        fd = os.open(CHECKPOINT_MONTHS, os.O_WRONLY | os.O_CREAT, 0o644)
+        try:
+            os.pwrite(fd, payload, 0)
+            os.ftruncate(fd, len(payload))
+            getattr(os, "fdatasync", os.fsync)(fd)
+        finally:
+            os.close(fd)
+        return
+    # POSIX atomic-write dance: write tmp, fsync it, rename over the target,
+    # then fsync the directory so the rename itself survives a crash.
     tmp = Path(str(CHECKPOINT_MONTHS) + ".tmp")
-    with open(tmp, "w", encoding="utf-8") as f:
-        json.dump(d, f, ensure_ascii=False, indent=2)
-    tmp.replace(CHECKPOINT_MONTHS)  # atomic on same filesystem
+    try:
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, payload)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp, CHECKPOINT_MONTHS)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    if hasattr(os, "O_DIRECTORY"):
+        dirfd = os.open(CHECKPOINT_MONTHS.resolve().parent, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dirfd)
+        finally:
+            os.close(dirfd)
+
+class _JournalHandle:
+    """Kept-open append handle for the checkpoint journal.
+
+    Opening and closing the journal for every append costs a syscall pair
+    per month; the handle stays open across saves and reopens only when the
+    checkpoint path changes (tests) or after compaction drops the journal.
+    """
+    def __init__(self) -> None:
+        self._f = None
+        self._path: Optional[Path] = None
+
+    def write_line(self, line: bytes) -> None:
+        p = _checkpoint_log_path()
+        if self._f is None or self._f.closed or self._path != p:
+            self.close()
+            self._f = open(p, "ab")
+            self._path = p
+        self._f.write(line)
+        self._f.flush()
+        os.fsync(self._f.fileno())
+
+    def close(self) -> None:
+        if self._f is not None and not self._f.closed:
+            self._f.close()
+        self._f = None
+        self._path = None
+
+_journal = _JournalHandle()
+atexit.register(_journal.close)
+
+def save_checkpoint_append(key: str, new_ids: Optional[List[int]] = None) -> None:
+    global _appends_since_compact
+    rec: Dict[str, Any] = {"done": key}
+    if new_ids:
+        rec["ids"] = list(new_ids)
+    _journal.write_line(orjson.dumps(rec) + b"\n")
+    _appends_since_compact += 1
+    if _appends_since_compact >= COMPACT_EVERY:
+        compact_checkpoint()
+
+def compact_checkpoint() -> None:
+    """Fold the append journal into the canonical file and drop the journal."""
+    global _appends_since_compact
+    save_checkpoint(load_checkpoint())
+    _journal.close()
+    _checkpoint_log_path().unlink(missing_ok=True)
+    _appends_since_compact = 0
+
+def _compact_at_exit() -> None:
+    # An interrupted run (Ctrl-C mid-backfill) exits with appends still
+    # only in the journal; fold them into the canonical file so the next
+    # run starts from one compact blob instead of replaying the log.
+    if _appends_since_compact and _checkpoint_log_path().exists():
+        compact_checkpoint()
+
+atexit.register(_compact_at_exit)
+
+class CheckpointWriter:
+    """Queue-backed daemon thread that journals checkpoints off the hot path.
+
+    The fsync per journal append is a full disk round-trip; enqueueing the
+    record instead lets the ingestion loop continue with the next month
+    while the write happens in the background. flush() blocks until every
+    queued record is durable, so callers can fence before compaction or
+    shutdown. Records are not coalesced — each one is an append, not a
+    rewrite, so skipping any would lose a completed month.
+    """
+    def __init__(self) -> None:
+        self.q: "queue.Queue[Optional[Tuple[str, List[int]]]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run,
+                                            name="checkpoint-writer", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            item = self.q.get()
+            try:
+                if item is None:
+                    return
+                key, new_ids = item
+                save_checkpoint_append(key, new_ids)
+            except Exception:
+                log.exception("Checkpoint write failed for %s", item)
+            finally:
+                self.q.task_done()
+
+    def put(self, key: str, new_ids: Optional[List[int]] = None) -> None:
+        self._ensure_thread()
+        self.q.put((key, new_ids))
+
+    def flush(self) -> None:
+        self.q.join()
+
+_checkpoint_writer = CheckpointWriter()
 
 def load_checkpoint() -> Dict[str, Any]:
+    done: set = set()
+    seen_ids: set = set()
     if CHECKPOINT_MONTHS.exists():
         try:
-            with open(CHECKPOINT_MONTHS, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, OSError):
+            with open(CHECKPOINT_MONTHS, "rb") as f:
+                cp = orjson.loads(f.read())
+            done.update(cp.get("done_months", []))
+            seen_ids.update(cp.get("seen_ids", []))
+        except (orjson.JSONDecodeError, OSError):
             log.warning("Checkpoint file corrupted, starting fresh.")
-            return {"done_months": []}
-    return {"done_months": []}
+    logp = _checkpoint_log_path()
+    if logp.exists():
+        try:
+            with open(logp, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        rec = orjson.loads(line)
+                        done.add(rec["done"])
+                        seen_ids.update(rec.get("ids", []))
+                    except (orjson.JSONDecodeError, KeyError, TypeError):
+                        log.warning("Skipping corrupt checkpoint log line.")
+        except OSError:
+            log.warning("Checkpoint log unreadable, ignoring it.")
+    out: Dict[str, Any] = {"done_months": sorted(done)}
+    if seen_ids:
+        out["seen_ids"] = sorted(seen_ids)
+    return out
 
 def part_filename(start: str, end: str) -> Path:
-    return OUT_DIR / f"tmdb_{start}_to_{end}.parquet"
+    return OUT_DIR / f"tmdb_{start}_to_{end}.feather"
+
+# Canonical Arrow schema for part/master files. `genres` and
+# `original_language` are low-cardinality, so they are stored
+# dictionary-encoded (int32 codes + one value table) instead of repeated
+# UTF-8; the in-DataFrame representation stays a plain pipe-joined string.
+# Casting every part to one fixed schema also keeps empty months (all-null
+# columns) compatible with the streaming master writer.
+PART_SCHEMA = pa.schema([
+    pa.field("tmdb_id", pa.int64()),
+    pa.field("title", pa.string()),
+    pa.field("original_title", pa.string()),
+    pa.field("release_date", pa.string()),
+    pa.field("genres", pa.dictionary(pa.int32(), pa.string())),
+    pa.field("vote_average", pa.float64()),
+    pa.field("vote_count", pa.int64()),
+    pa.field("popularity", pa.float64()),
+    pa.field("original_language", pa.dictionary(pa.int32(), pa.string())),
+    pa.field("overview", pa.string()),
+    pa.field("poster_url", pa.string()),
+])
+
+def _mask_dict_nulls(arr: pa.DictionaryArray) -> pa.DictionaryArray:
+    """Re-encode null dictionary entries as a masked valid index.
+
+    pandas Categoricals mark nulls with index -1; polars' IPC reader
+    rejects that encoding outright ("must fit in a usize"). Null slots
+    get index 0 with the validity bit cleared instead, which every Arrow
+    reader accepts and which round-trips back to null.
+    """
+    indices = arr.indices
+    null_mask = pc.is_null(indices).to_numpy(zero_copy_only=False)
+    values = arr.dictionary
+    if len(values) == 0:  # all-null column: give index 0 something to point at
+        values = pa.array([""], type=values.type)
+    # from_arrays only honors `mask` for numpy index input
+    filled = pc.fill_null(indices, 0).to_numpy(zero_copy_only=False)
+    return pa.DictionaryArray.from_arrays(filled, values, mask=null_mask)
+
+def to_part_table(df: pd.DataFrame) -> pa.Table:
+    # Peak memory per part is bounded by construction: a month holds at
+    # most TMDB_MAX_PAGES * 20 = 10k rows, so the frame and its Arrow copy
+    # coexisting here is a few MB. The master never materializes at all —
+    # write_master streams it through polars sinks part by part.
+    tbl = pa.Table.from_pandas(df, preserve_index=False).combine_chunks()
+    tbl = tbl.cast(PART_SCHEMA)
+    for i, field in enumerate(PART_SCHEMA):
+        if pa.types.is_dictionary(field.type) and tbl.column(i).null_count:
+            fixed = _mask_dict_nulls(tbl.column(i).combine_chunks())
+            tbl = tbl.set_column(i, field, fixed)
+    return tbl
+
+def scan_parts(parts: List[str]) -> "pl.LazyFrame":
+    """Lazy scan over part files, normalized for the master sink.
+
+    The dictionary-encoded columns are cast back to plain strings so the
+    master keeps the schema it always had and the streaming sinks never
+    see categorical null codes (see _mask_dict_nulls for the write-side
+    half of that contract). The unique() is a cheap safety net — parts
+    are already deduped at ingest, it only guards against stale parts
+    from earlier, differently-ranged runs.
+    """
+    return (pl.scan_ipc(parts)
+              .with_columns(pl.col("genres", "original_language").cast(pl.String))
+              .unique(subset=["tmdb_id"], keep="first"))
+
+def write_master(lf: "pl.LazyFrame", parquet_path: Path,
+                 csv_path: Optional[Path] = None) -> None:
+    """Sink the master parquet and optionally derive the CSV from it.
+
+    The CSV is produced from the freshly written parquet rather than by
+    re-running the whole scan+dedup pipeline a second time, so the parts
+    are read and deduplicated exactly once per run.
+    """
+    lf.sink_parquet(parquet_path, compression="zstd")
+    if csv_path is not None:
+        pl.scan_parquet(parquet_path).sink_csv(csv_path)
+
+def write_part(df: pd.DataFrame, outp: Path) -> None:
+    # Parts are scratch files read back exactly once at concat time;
+    # Feather+LZ4 is cheaper than parquet on both ends. The 1 MiB buffer
+    # lets column chunks hit the OS as a few big writes.
+    with open(outp, "wb", buffering=1 << 20) as f:
+        feather.write_feather(to_part_table(df), f, compression="lz4")
 
 # ---------- date partitioning ----------
+_MDAYS = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+def _last_day(year: int, month: int) -> int:
+    return _MDAYS[month - 1] + (
+        1 if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0) else 0
+    )
+
 def month_ranges(start_date_str: str, end_date_str: str) -> List[Tuple[str, str]]:
-    s = pd.to_datetime(start_date_str).date()
-    e = pd.to_datetime(end_date_str).date()
-    cur = date(s.year, s.month, 1)
-    out = []
-    while cur <= e:
-        nxt = cur + relativedelta(months=1)
-        last_day = nxt - timedelta(days=1)
-        out.append((cur.isoformat(), min(last_day, e).isoformat()))
-        cur = nxt
-    return out
+    # One date_range call yields every month start; each end is the start's
+    # "YYYY-MM-" prefix plus the table-driven month length, clipped to the
+    # overall end (ISO strings compare lexically, so min() is the clip).
+    starts = pd.date_range(pd.Timestamp(start_date_str).replace(day=1),
+                           end_date_str, freq="MS")
+    return [
+        (s, min(f"{s[:8]}{_last_day(y, m):02d}", end_date_str))
+        for s, y, m in zip(starts.strftime("%Y-%m-%d"), starts.year, starts.month)
+    ]
 
 # ---------- dynamic output paths ----------
 def master_paths(start: str, end: str) -> Tuple[Path, Path]:
+    """Master file paths for a YYYY-MM-DD range; years come from substring
+    slices, no datetime parsing needed."""
     year_from, year_to = start[:4], end[:4]
     suffix = year_from if year_from == year_to else f"{year_from}-{year_to}"
     return Path(f"tmdb_movies_{suffix}.csv"), Path(f"tmdb_movies_{suffix}.parquet")
 
 # ---------- monthly backfill runner ----------
-def run_monthly_backfill(start: str, end: str, language: str = "en-US",
-                         min_votes: int = 0, max_pages: Optional[int] = None) -> None:
+REQUEST_CONCURRENCY = 8
+
+async def _backfill_months_async(start: str, end: str, language: str = "en-US",
+                                 min_votes: int = 0, max_pages: Optional[int] = None,
+                                 concurrency: int = REQUEST_CONCURRENCY) -> None:
     log.info("Fetching TMDB configuration and genres...")
     image_base, poster_size = get_image_base_and_size()
     genres_map = get_genre_map(language)
     log.info("Image base: %s  size: %s", image_base, poster_size)
     log.debug("Genre sample: %s", list(genres_map.items())[:6])
 
-    master_csv, master_parquet = master_paths(start, end)
     ranges = month_ranges(start, end)
     cp = load_checkpoint()
     done = set(cp.get("done_months", []))
+    # ids already written to parts in this or previous runs; rows matching
+    # them are dropped at ingest so parts never carry cross-month duplicates
+    seen_ids = set(cp.get("seen_ids", []))
 
+    pending: List[Tuple[str, str]] = []
     for a, b in ranges:
-        key = f"{a}_{b}"
-        if key in done:
+        if f"{a}_{b}" in done:
             log.info("SKIP %s -> %s (already done)", a, b)
-            continue
+        else:
+            pending.append((a, b))
+    if not pending:
+        return
 
-        log.info("=== Processing %s -> %s ===", a, b)
-        try:
-            raw = discover_all(a, b, language=language, min_votes=min_votes, max_pages=max_pages)
-            log.info("Raw items fetched: %d", len(raw))
+    # One semaphore shared by every month so the request budget is global,
+    # and one lock so checkpoint writes never interleave.
+    sem = asyncio.Semaphore(concurrency)
+    bucket = TokenBucket()
+    cp_lock = asyncio.Lock()
 
-            if not raw:
-                df_part = pd.DataFrame(columns=COLS)
-            else:
-                df_part = normalize_to_df(raw, image_base, poster_size, genres_map)
-                df_part = df_part.drop_duplicates(subset=["tmdb_id"]).reset_index(drop=True)
+    async with make_aiohttp_session() as session:
 
-            outp = part_filename(a, b)
-            df_part.to_parquet(outp, index=False)
-            log.info("Saved part: %s  rows: %d", outp, len(df_part))
+        async def process_month(a: str, b: str) -> str:
+            key = f"{a}_{b}"
+            log.info("=== Processing %s -> %s ===", a, b)
+            try:
+                raw = await discover_all_async(a, b, language=language, min_votes=min_votes,
+                                               max_pages=max_pages, session=session,
+                                               sem=sem, bucket=bucket)
+                log.info("Raw items fetched for %s: %d", key, len(raw))
+
+                if not raw:
+                    df_part = pd.DataFrame(columns=COLS)
+                else:
+                    # Normalization is pure CPU; run it on a worker thread so
+                    # the event loop keeps other months' pages in flight.
+                    df_part = await asyncio.to_thread(normalize_to_df_parallel, raw,
+                                                      image_base, poster_size, genres_map)
+                    df_part = df_part.drop_duplicates(subset=["tmdb_id"]).reset_index(drop=True)
+                    mask = ~df_part["tmdb_id"].isin(seen_ids)
+                    if not mask.all():
+                        df_part = df_part[mask].reset_index(drop=True)
+
+                new_ids = df_part["tmdb_id"].tolist() if len(df_part) else []
+                seen_ids.update(new_ids)
+
+                outp = part_filename(a, b)
+                # Same reasoning for the encode+write: overlap it with fetches.
+                await asyncio.to_thread(write_part, df_part, outp)
+                log.info("Saved part: %s  rows: %d", outp, len(df_part))
+
+                async with cp_lock:
+                    done.add(key)
+                    _checkpoint_writer.put(key, new_ids)
+                return key
+            except Exception:
+                log.exception("ERROR during month: %s -> %s", a, b)
+                raise
 
-            done.add(key)
-            save_checkpoint({"done_months": sorted(done)})
+        results = await asyncio.gather(*(process_month(a, b) for a, b in pending),
+                                       return_exceptions=True)
 
-        except Exception:
-            log.exception("ERROR during month: %s -> %s", a, b)
-            raise
+    _checkpoint_writer.flush()
+    compact_checkpoint()
+
+    errors = [r for r in results if isinstance(r, BaseException)]
+    if errors:
+        raise errors[0]
+
+def run_monthly_backfill(start: str, end: str, language: str = "en-US",
+                         min_votes: int = 0, max_pages: Optional[int] = None,
+                         emit_csv: bool = False) -> None:
+    asyncio.run(_backfill_months_async(start, end, language=language,
+                                       min_votes=min_votes, max_pages=max_pages))
+
+    master_csv, master_parquet = master_paths(start, end)
 
     log.info("Concatenating monthly parts...")
-    parts = sorted(OUT_DIR.glob("tmdb_*.parquet"))
+    # os.scandir streams DirEntry objects with cached stat info; pathlib's
+    # glob would stat each entry again. ISO dates in the names make the
+    # lexical sort chronological.
+    with os.scandir(OUT_DIR) as it:
+        parts = sorted(e.path for e in it
+                       if e.is_file() and e.name.startswith("tmdb_") and e.name.endswith(".feather"))
     if not parts:
         log.warning("No parts found to concatenate. Exiting.")
         return
 
-    df = pd.concat([pd.read_parquet(p) for p in parts], ignore_index=True)
-    df = df.drop_duplicates(subset=["tmdb_id"]).reset_index(drop=True)
-    log.info("Final unique rows: %d", len(df))
-    df.to_csv(master_csv, index=False, encoding="utf-8")
-    df.to_parquet(master_parquet, index=False)
-    log.info("Saved master files: %s  %s", master_csv, master_parquet)
+    # Lazy scan + streaming sink: polars reads the parts multi-threaded and
+    # never materializes the full range in memory.
+    write_master(scan_parts(parts), master_parquet,
+                 master_csv if emit_csv else None)
+
+    log.info("Final unique rows: %d", pq.read_metadata(master_parquet).num_rows)
+    if emit_csv:
+        log.info("Saved master files: %s  %s", master_csv, master_parquet)
+    else:
+        log.info("Saved master file: %s", master_parquet)
 
 # ---------- CLI ----------
 def parse_args():
@@ -306,6 +887,10 @@ def parse_args():
     p.add_argument("--lang", dest="lang",       default=os.getenv("LANGUAGE",  "en-US"),      help="language code")
     p.add_argument("--min-votes", dest="min_votes", type=int, default=0,    help="minimum vote_count")
     p.add_argument("--max-pages", dest="max_pages", type=int, default=None, help="limit discover pages per month")
+    p.add_argument("--emit-csv", dest="emit_csv", action="store_true",
+                   help="also write the master as CSV (parquet is always written)")
+    p.add_argument("--no-cache", dest="no_cache", action="store_true",
+                   help="bypass the local HTTP response cache")
     p.add_argument("--log-level", dest="log_level", default="INFO",
                    choices=["DEBUG", "INFO", "WARNING", "ERROR"], help="log verbosity")
     p.add_argument("--log-file",  dest="log_file",  default=None, help="also write logs to this file")
@@ -314,6 +899,9 @@ def parse_args():
 if __name__ == "__main__":
     args = parse_args()
     setup_logging(args.log_level, args.log_file)
+    if args.no_cache:
+        SESSION = make_session(use_cache=False)
     log.info("Starting backfill: %s -> %s  lang: %s", args.date_from, args.date_to, args.lang)
     run_monthly_backfill(args.date_from, args.date_to,
-                         language=args.lang, min_votes=args.min_votes, max_pages=args.max_pages)
+                         language=args.lang, min_votes=args.min_votes,
+                         max_pages=args.max_pages, emit_csv=args.emit_csv)
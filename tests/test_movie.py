@@ -4,7 +4,9 @@ Unit tests for src/movie.py
 Sadece saf fonksiyonlar test edilir (API çağrısı yapılmaz).
 conftest.py TMDB_BEARER'ı import öncesi set eder.
 """
-import json
+import asyncio
+from types import MappingProxyType
+
 import pytest
 import pandas as pd
 
@@ -12,27 +14,29 @@ import src.movie as movie
 
 COLS = movie.COLS
 
+# Donmuş prototip: her _raw çağrısında dict literal'i yeniden kurmak yerine
+# tek kopya + override merge. MappingProxyType yanlışlıkla mutasyonu engeller.
+_BASE_RAW = MappingProxyType({
+    "id": 1,
+    "title": "Test Movie",
+    "original_title": "Test Movie OT",
+    "release_date": "2023-06-15",
+    "genre_ids": [28, 35],
+    "vote_average": 7.5,
+    "vote_count": 1000,
+    "popularity": 120.5,
+    "original_language": "en",
+    "overview": "A test movie.",
+    "poster_path": "/abc123.jpg",
+})
+
 
 # ------------------------------------------------------------------ #
 #  normalize_to_df                                                     #
 # ------------------------------------------------------------------ #
 class TestNormalizeToDf:
     def _raw(self, **overrides):
-        base = {
-            "id": 1,
-            "title": "Test Movie",
-            "original_title": "Test Movie OT",
-            "release_date": "2023-06-15",
-            "genre_ids": [28, 35],
-            "vote_average": 7.5,
-            "vote_count": 1000,
-            "popularity": 120.5,
-            "original_language": "en",
-            "overview": "A test movie.",
-            "poster_path": "/abc123.jpg",
-        }
-        base.update(overrides)
-        return base
+        return {**_BASE_RAW, **overrides}
 
     def test_output_columns_match_schema(self):
         df = movie.normalize_to_df(
@@ -80,20 +84,42 @@ class TestNormalizeToDf:
         assert len(df) == 3
         assert list(df["tmdb_id"]) == [1, 2, 3]
 
+    def test_parallel_matches_sequential(self, monkeypatch):
+        monkeypatch.setattr(movie, "PARALLEL_NORMALIZE_MIN_ROWS", 2)
+        raws = [self._raw(id=i, title=f"Movie {i}") for i in range(1, 7)]
+        gmap = {28: "Action", 35: "Comedy"}
+        seq = movie.normalize_to_df(raws, "https://cdn/", "w500", gmap)
+        par = movie.normalize_to_df_parallel(raws, "https://cdn/", "w500", gmap, workers=2)
+        pd.testing.assert_frame_equal(seq, par)
+
+    def test_parallel_small_input_stays_sequential(self):
+        # threshold altında süreç havuzu açılmaz, doğrudan delegasyon
+        df = movie.normalize_to_df_parallel([self._raw()], "https://cdn/", "w500", {})
+        assert len(df) == 1
+
 
 # ------------------------------------------------------------------ #
 #  month_ranges                                                        #
 # ------------------------------------------------------------------ #
+@pytest.fixture(scope="module")
+def month_tuples():
+    """Testlerde tekrar eden ay aralıkları — modül başına bir kez kurulur."""
+    return {
+        "dec_2022": ("2022-12-01", "2022-12-31"),
+        "jan_2023": ("2023-01-01", "2023-01-31"),
+        "feb_2023": ("2023-02-01", "2023-02-28"),
+    }
+
+
 class TestMonthRanges:
-    def test_single_full_month(self):
-        assert movie.month_ranges("2023-01-01", "2023-01-31") == [
-            ("2023-01-01", "2023-01-31")
-        ]
+    def test_single_full_month(self, month_tuples):
+        jan = month_tuples["jan_2023"]
+        assert movie.month_ranges(*jan) == [jan]
 
-    def test_two_full_months(self):
+    def test_two_full_months(self, month_tuples):
         assert movie.month_ranges("2023-01-01", "2023-02-28") == [
-            ("2023-01-01", "2023-01-31"),
-            ("2023-02-01", "2023-02-28"),
+            month_tuples["jan_2023"],
+            month_tuples["feb_2023"],
         ]
 
     def test_end_clipped_mid_month(self):
@@ -105,11 +131,11 @@ class TestMonthRanges:
         result = movie.month_ranges("2023-03-15", "2023-04-30")
         assert result[0][0] == "2023-03-01"
 
-    def test_year_boundary(self):
+    def test_year_boundary(self, month_tuples):
         result = movie.month_ranges("2022-12-01", "2023-01-31")
         assert result == [
-            ("2022-12-01", "2022-12-31"),
-            ("2023-01-01", "2023-01-31"),
+            month_tuples["dec_2022"],
+            month_tuples["jan_2023"],
         ]
 
     def test_same_start_and_end(self):
@@ -127,7 +153,7 @@ class TestCheckpoint:
 
     def test_load_returns_empty_when_file_corrupted(self, tmp_path, monkeypatch):
         cp = tmp_path / "cp.json"
-        cp.write_text("not valid json {{ }", encoding="utf-8")
+        cp.write_bytes(b"{ not valid json")
         monkeypatch.setattr(movie, "CHECKPOINT_MONTHS", cp)
         assert movie.load_checkpoint() == {"done_months": []}
 
@@ -142,6 +168,22 @@ class TestCheckpoint:
         movie.save_checkpoint({"done_months": []})
         assert not (tmp_path / "cp.json.tmp").exists()
 
+    def test_save_and_load_roundtrip_large_payload(self, tmp_path, monkeypatch):
+        # SMALL_CHECKPOINT_BYTES üstü → tmp+rename yolu
+        monkeypatch.setattr(movie, "CHECKPOINT_MONTHS", tmp_path / "cp.json")
+        data = {"done_months": [f"{y}-{m:02d}-01_{y}-{m:02d}-28"
+                                for y in range(2020, 2025) for m in range(1, 13)]}
+        movie.save_checkpoint(data)
+        assert movie.load_checkpoint() == data
+        assert not (tmp_path / "cp.json.tmp").exists()
+
+    def test_save_shrinks_file_when_payload_shrinks(self, tmp_path, monkeypatch):
+        # in-place yazım sonrası eski kuyruk kalmamalı (ftruncate)
+        monkeypatch.setattr(movie, "CHECKPOINT_MONTHS", tmp_path / "cp.json")
+        movie.save_checkpoint({"done_months": ["2023-01-01_2023-01-31", "2023-02-01_2023-02-28"]})
+        movie.save_checkpoint({"done_months": ["2023-01-01_2023-01-31"]})
+        assert movie.load_checkpoint() == {"done_months": ["2023-01-01_2023-01-31"]}
+
     def test_save_overwrites_previous(self, tmp_path, monkeypatch):
         monkeypatch.setattr(movie, "CHECKPOINT_MONTHS", tmp_path / "cp.json")
         movie.save_checkpoint({"done_months": ["2023-01-01_2023-01-31"]})
@@ -149,6 +191,103 @@ class TestCheckpoint:
         result = movie.load_checkpoint()
         assert len(result["done_months"]) == 2
 
+    def test_append_merges_with_canonical_file(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(movie, "CHECKPOINT_MONTHS", tmp_path / "cp.json")
+        movie.save_checkpoint({"done_months": ["2023-01-01_2023-01-31"]})
+        movie.save_checkpoint_append("2023-02-01_2023-02-28")
+        assert movie.load_checkpoint() == {
+            "done_months": ["2023-01-01_2023-01-31", "2023-02-01_2023-02-28"]
+        }
+
+    def test_compact_folds_log_into_canonical(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(movie, "CHECKPOINT_MONTHS", tmp_path / "cp.json")
+        movie.save_checkpoint_append("2023-01-01_2023-01-31")
+        movie.save_checkpoint_append("2023-01-01_2023-01-31")  # duplicate append
+        movie.compact_checkpoint()
+        assert not (tmp_path / "cp.jsonl").exists()
+        assert movie.load_checkpoint() == {"done_months": ["2023-01-01_2023-01-31"]}
+
+    def test_append_persists_seen_ids(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(movie, "CHECKPOINT_MONTHS", tmp_path / "cp.json")
+        movie.save_checkpoint_append("2023-01-01_2023-01-31", [3, 1, 2])
+        movie.compact_checkpoint()
+        cp = movie.load_checkpoint()
+        assert cp["seen_ids"] == [1, 2, 3]
+
+    def test_checkpoint_writer_flush_makes_records_visible(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(movie, "CHECKPOINT_MONTHS", tmp_path / "cp.json")
+        writer = movie.CheckpointWriter()
+        writer.put("2023-01-01_2023-01-31", [7])
+        writer.flush()
+        cp = movie.load_checkpoint()
+        assert cp["done_months"] == ["2023-01-01_2023-01-31"]
+        assert cp["seen_ids"] == [7]
+
+    def test_corrupt_log_line_is_skipped(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(movie, "CHECKPOINT_MONTHS", tmp_path / "cp.json")
+        movie.save_checkpoint_append("2023-01-01_2023-01-31")
+        with open(tmp_path / "cp.jsonl", "a", encoding="utf-8") as f:
+            f.write("bozuk satır {{\n")
+        assert movie.load_checkpoint() == {"done_months": ["2023-01-01_2023-01-31"]}
+
+
+# ------------------------------------------------------------------ #
+#  part / master round trip                                            #
+# ------------------------------------------------------------------ #
+class TestPartMasterRoundTrip:
+    def _raw(self, **overrides):
+        return {**_BASE_RAW, **overrides}
+
+    def test_null_language_survives_part_to_master(self, tmp_path):
+        # original_language=None part dosyasına null dictionary girdisi yazar;
+        # master sink bunu string'e cast etmeden patlıyordu (polars >=1.x)
+        raws = [
+            self._raw(id=1, original_language=None),
+            self._raw(id=2, original_language="en"),
+        ]
+        df = movie.normalize_to_df(raws, "https://cdn/", "w500", {28: "Action", 35: "Comedy"})
+        part = tmp_path / "tmdb_2023-01-01_to_2023-01-31.feather"
+        movie.write_part(df, part)
+
+        empty_part = tmp_path / "tmdb_2023-02-01_to_2023-02-28.feather"
+        movie.write_part(pd.DataFrame(columns=COLS), empty_part)
+
+        master_parquet = tmp_path / "master.parquet"
+        master_csv = tmp_path / "master.csv"
+        movie.write_master(movie.scan_parts([str(part), str(empty_part)]),
+                           master_parquet, master_csv)
+
+        out = pd.read_parquet(master_parquet).sort_values("tmdb_id").reset_index(drop=True)
+        assert list(out["tmdb_id"]) == [1, 2]
+        assert out["original_language"].isna().iloc[0]
+        assert out["original_language"].iloc[1] == "en"
+        assert master_csv.exists()
+
+
+# ------------------------------------------------------------------ #
+#  TokenBucket                                                         #
+# ------------------------------------------------------------------ #
+class TestTokenBucket:
+    def test_acquire_consumes_tokens(self):
+        bucket = movie.TokenBucket(rate=1000.0, capacity=5)
+
+        async def take_two():
+            await bucket.acquire()
+            await bucket.acquire()
+
+        asyncio.run(take_two())
+        # 2 taken, refill at this rate is negligible within the run
+        assert bucket.tokens < 4.0
+
+    def test_capacity_is_upper_bound(self):
+        bucket = movie.TokenBucket(rate=1000.0, capacity=3)
+
+        async def take_one():
+            await bucket.acquire()
+
+        asyncio.run(take_one())
+        assert bucket.tokens <= bucket.capacity
+
 
 # ------------------------------------------------------------------ #
 #  master_paths                                                        #